@@ -1,11 +1,22 @@
 # coding: utf-8
 from appdirs import *
+import atexit
+import functools
 import platform
+import random
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectTimeout
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 from .eikonError import *
 from .tools import is_string_type
 import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import logging
 from logging.handlers import RotatingFileHandler
@@ -13,6 +24,33 @@ from logging.handlers import RotatingFileHandler
 # global profile
 profile = None
 
+# application id cached at module level so get_app_id callers in tight
+# loops skip the profile attribute walk
+_app_id = None
+
+
+class _JitterRetry(Retry):
+    """Retry policy adding a random jitter to the exponential backoff."""
+    def get_backoff_time(self):
+        backoff = super(_JitterRetry, self).get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.random() * self.backoff_factor
+
+
+def _build_retry():
+    try:
+        return _JitterRetry(total=3, backoff_factor=0.2,
+                            status_forcelist=(502, 503, 504),
+                            allowed_methods=frozenset(['POST']),
+                            respect_retry_after_header=True)
+    except TypeError:
+        # urllib3 < 1.26 spells allowed_methods as method_whitelist
+        return _JitterRetry(total=3, backoff_factor=0.2,
+                            status_forcelist=(502, 503, 504),
+                            method_whitelist=frozenset(['POST']),
+                            respect_retry_after_header=True)
+
 
 def set_app_id(app_id):
     """
@@ -42,6 +80,8 @@ def get_app_id():
     You can get an application ID using the Application ID generator. This App can
     be launched from TR Eikon Proxy welcome page.
     """
+    if _app_id is not None:
+        return _app_id
     return profile.get_application_id()
 
 
@@ -83,6 +123,25 @@ def get_port_number():
     return profile.get_port_number()
 
 
+def set_pool_size(pool_size):
+    """
+    Set the maximum number of pooled connections kept to the Eikon API proxy.
+
+    Parameters
+    ----------
+    pool_size : int
+        the maximum number of connections to keep in the pool
+    """
+    get_profile().set_pool_size(pool_size)
+
+
+def get_pool_size():
+    """
+    Returns the maximum number of pooled connections
+    """
+    return profile.get_pool_size()
+
+
 def get_profile():
     """
     Returns a Profile class containing the EPAID
@@ -120,10 +179,21 @@ class Profile(object):
 
         self.session = Session()
         self.session.trust_env = False
+        self.session.headers.update({'Connection': 'keep-alive'})
+        atexit.register(self.session.close)
+        self.set_pool_size(32)
+        self.aclient = None
         self.port = None
         self.url = None
         self.streaming_url = None
 
+        self.application_id = None
+        # cache the bound post method and the headers dict so the request
+        # hot path in send_json_request is a couple of attribute loads
+        self._post = self.session.post
+        self._headers = {'Content-Type': 'application/json',
+                         'x-tr-applicationid': self.application_id}
+
         self.set_application_id(application_id)
         self.set_timeout(30)
 
@@ -137,7 +207,11 @@ class Profile(object):
         if not is_string_type(app_id):
             raise AttributeError('application_id must be a string')
 
+        global _app_id
+        _app_id = app_id
         self.application_id = app_id
+        self._headers = {'Content-Type': 'application/json',
+                         'x-tr-applicationid': self.application_id}
         self.set_port_number(identify_scripting_proxy_port(self.session, self.application_id))
         self.logger.info('Application ID: {0}'.format(self.application_id))
 
@@ -165,6 +239,45 @@ class Profile(object):
         """
         return self.session
 
+    def set_pool_size(self, pool_size):
+        """
+        Set the maximum number of pooled connections kept to the Eikon API proxy.
+
+        The proxy is a single localhost host, so pool_maxsize governs how many
+        keep-alive sockets concurrent requests can reuse.
+        """
+        self.pool_size = pool_size
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False,
+                              max_retries=_build_retry())
+        self.session.mount('http://', adapter)
+        self.logger.info('Set connection pool size to {0}'.format(self.pool_size))
+
+    def get_pool_size(self):
+        """
+        Returns the maximum number of pooled connections
+        """
+        return self.pool_size
+
+    def get_async_client(self):
+        """
+        Returns the httpx.AsyncClient used by send_json_request_async.
+
+        The client is created lazily on first use. httpx is an optional
+        dependency; HTTP/2 multiplexing over a single connection is enabled
+        when the h2 package is also installed.
+        """
+        if httpx is None:
+            raise EikonError('httpx', 'httpx must be installed to use send_json_request_async')
+
+        if self.aclient is None:
+            limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            try:
+                self.aclient = httpx.AsyncClient(http2=True, limits=limits, timeout=60)
+            except ImportError:
+                # h2 is not installed, fall back to HTTP/1.1 keep-alive
+                self.aclient = httpx.AsyncClient(limits=limits, timeout=60)
+        return self.aclient
+
     def set_timeout(self, timeout):
         """
         Set the timeout for requests.
@@ -252,13 +365,14 @@ def read_firstline_in_file(filename):
         return ''
 
 
-def identify_scripting_proxy_port(session, application_id):
-    """
-    Returns the port used by the Scripting Proxy stored in a configuration file.
+@functools.lru_cache(maxsize=1)
+def _resolve_portinuse_path():
     """
+    Returns the path of the '.portInUse' file written by the Scripting Proxy.
 
-    port = None
-    logger = get_profile().logger
+    Resolving the configuration directory stats the filesystem for each
+    candidate application name, so the result is cached for the process.
+    """
     app_names = ['Eikon API proxy', 'Eikon Scripting Proxy']
     app_author = 'Thomson Reuters'
 
@@ -270,25 +384,47 @@ def identify_scripting_proxy_port(session, application_id):
                 for app_name in app_names if os.path.isdir(user_data_dir(app_name, app_author, roaming=True))]
 
     if len(path):
-        port_in_use_file = os.path.join(path[0], '.portInUse')
+        return os.path.join(path[0], '.portInUse')
+    return None
+
+
+# (mtime, port) of the last '.portInUse' file successfully validated, so
+# rebuilding a Profile only re-validates the port instead of re-reading
+_saved_port_cache = None
+
+
+def identify_scripting_proxy_port(session, application_id):
+    """
+    Returns the port used by the Scripting Proxy stored in a configuration file.
+    """
+    global _saved_port_cache
 
-        # Test if '.portInUse' file exists
-        if os.path.exists(port_in_use_file):
+    port = None
+    logger = get_profile().logger
+
+    port_in_use_file = _resolve_portinuse_path()
+
+    # Test if '.portInUse' file exists
+    if port_in_use_file is not None and os.path.exists(port_in_use_file):
+        mtime = os.path.getmtime(port_in_use_file)
+        if _saved_port_cache is not None and _saved_port_cache[0] == mtime:
+            saved_port = _saved_port_cache[1]
+        else:
             # First test to read .portInUse file
-            firstline = read_firstline_in_file(port_in_use_file)
-            if firstline != '':
-                saved_port = firstline.strip()
-                if check_port(session, application_id, saved_port):
-                    port = saved_port
-                    logger.info('Port {0} was retrieved from .portInUse file'.format(port))
+            saved_port = read_firstline_in_file(port_in_use_file).strip()
+        if saved_port != '' and check_port(session, application_id, saved_port):
+            port = saved_port
+            _saved_port_cache = (mtime, saved_port)
+            logger.info('Port {0} was retrieved from .portInUse file'.format(port))
 
     if port is None:
         logger.info('Warning: file .portInUse was not found. Try to fallback to default port number.')
-        port_list = ['9000', '36036']
-        for port_number in port_list:
-            logger.info('Try defaulting to port {0}...'.format(port_number))
-            if check_port(session, application_id, port_number):
-                return port_number
+        port = scan_ports(application_id, ['9000', '36036'])
+        if port is not None:
+            # re-probe on the shared session so the first real request finds
+            # a warm keep-alive socket instead of paying a fresh handshake
+            check_port(session, application_id, port)
+            return port
 
     if port is None:
         logger.error('Error: no proxy address identified.\nCheck if Eikon Desktop or Eikon API Proxy is running.')
@@ -296,6 +432,29 @@ def identify_scripting_proxy_port(session, application_id):
     return port
 
 
+def scan_ports(application_id, port_list):
+    """
+    Probe the candidate proxy ports concurrently and return the first one
+    that answers, so cold-start latency is max(timeouts) instead of the sum.
+    """
+    logger = get_profile().logger
+    with ThreadPoolExecutor(max_workers=len(port_list)) as executor:
+        futures = {}
+        for port_number in port_list:
+            logger.info('Try defaulting to port {0}...'.format(port_number))
+            # one session per probe so the startup scan does not contend
+            # on the shared connection pool
+            probe_session = Session()
+            probe_session.trust_env = False
+            futures[executor.submit(check_port, probe_session, application_id, port_number)] = port_number
+        for future in as_completed(futures):
+            if future.result():
+                for pending in futures:
+                    pending.cancel()
+                return futures[future]
+    return None
+
+
 def check_port(session, application_id, port, timeout=(1.0,2.0)):
     logger = get_profile().logger
     url = "http://localhost:{0}/api/v1/data".format(port)
@@ -303,6 +462,8 @@ def check_port(session, application_id, port, timeout=(1.0,2.0)):
         response = session.get(url,
                             headers = {'x-tr-applicationid': application_id},
                             timeout=timeout)
+        # drain the body so the pooled connection goes back idle keep-alive
+        response.content
 
         logger.info('Response : {0} - {1}'.format(response.status_code, response.text))
         logger.info('Port {0} is detected'.format(port))
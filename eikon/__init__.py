@@ -9,9 +9,10 @@ __version__ = '0.1.12'
 
 """
 
-from .Profile import set_app_id, get_app_id, set_timeout, get_timeout, set_port_number, get_port_number
+from .Profile import set_app_id, get_app_id, set_timeout, get_timeout, set_port_number, get_port_number, \
+    set_pool_size, get_pool_size
 from .symbology import get_symbology
-from .json_requests import send_json_request
+from .json_requests import send_json_request, send_json_request_async
 from .news_request import get_news_headlines, get_news_story
 from .time_series import get_timeseries
 from .data_grid import get_data, TR_Field
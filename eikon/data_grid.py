@@ -1,5 +1,7 @@
 # coding: utf-8
 
+import sys
+
 import eikon.json_requests
 from .tools import get_json_value,is_string_type, check_for_string_or_list_of_strings, check_for_string, build_dictionary, build_list, build_list_with_params
 import pandas as pd
@@ -7,6 +9,12 @@ import pandas as pd
 
 DataGrid_UDF_endpoint = 'DataGrid'
 
+# interned request keys so the per-field dicts hash pre-computed strings
+_K_NAME = sys.intern('name')
+_K_SORT = sys.intern('sort')
+_K_SORT_PRIORITY = sys.intern('sortPriority')
+_K_PARAMETERS = sys.intern('parameters')
+
 
 def TR_Field(field_name,params = None,sort_dir =None,sort_priority=None):
     """
@@ -28,10 +36,10 @@ def TR_Field(field_name,params = None,sort_dir =None,sort_priority=None):
     TR_Field('TR.GrossProfit',{'Scale': 6, 'Curn': 'EUR'},'asc',0)
 
     """
-    if params is not None and type(params) != dict:
+    if params is not None and not isinstance(params, dict):
         raise ValueError('TR_Field error: The argument params must be a dictionary')
-    
-    if type(params) == dict and not bool(params):
+
+    if isinstance(params, dict) and not bool(params):
         raise ValueError('TR_Field error: The argument params must be a non empty dictionary or set to None (default value if not set)')
 
     field = {field_name:{}}
@@ -124,7 +132,7 @@ def get_data(instruments, fields, parameters=None, field_name=False, raw_output=
 
     check_for_string_or_list_of_strings(instruments, 'instruments')
     instruments = build_list(instruments, 'instruments')
-    instruments = [value.upper() if value.islower() else value for value in instruments]
+    instruments = [value.upper() for value in instruments]
 
     if parameters:
         parameters = build_dictionary(parameters, 'parameters')
@@ -132,19 +140,20 @@ def get_data(instruments, fields, parameters=None, field_name=False, raw_output=
     fields = parse_fields(fields)
     fields_for_request = []
     for f in fields:
-        keys =  list(f.keys())
-        if len(keys) != 1: raise ValueError('get_data error: The field dictionary should contain a single key which is the field name')
-        name = list(f.keys())[0]
-        field_info = f[name]
-        if type(field_info) != dict:
+        if len(f) != 1: raise ValueError('get_data error: The field dictionary should contain a single key which is the field name')
+        name, field_info = next(iter(f.items()))
+        if not isinstance(field_info, dict):
             logger.error("get_data error :The parameters for the file {0} should be passed in a dict".format(name))
             return None,"The parameters for field {0} are invalid".format(name)
 
-        field = {'name':name}
-        if 'sort_dir' in list(field_info.keys()):field['sort'] = field_info['sort_dir']
-        if 'sort_priority' in list(field_info.keys()):field['sortPriority'] = field_info['sort_priority']
-        if 'params' in list(field_info.keys()):field['parameters'] = field_info['params']
-        fields_for_request.append (field)
+        field = {_K_NAME: name}
+        sort_dir = field_info.get('sort_dir')
+        if sort_dir is not None: field[_K_SORT] = sort_dir
+        sort_priority = field_info.get('sort_priority')
+        if sort_priority is not None: field[_K_SORT_PRIORITY] = sort_priority
+        params = field_info.get('params')
+        if params is not None: field[_K_PARAMETERS] = params
+        fields_for_request.append(field)
      
     payload = {'instruments': instruments,'fields': fields_for_request}
     if parameters: payload.update({'parameters': parameters})
@@ -158,25 +167,14 @@ def get_data(instruments, fields, parameters=None, field_name=False, raw_output=
 
 def parse_fields(fields):
     if is_string_type(fields): return [{fields:{}}]
-    if type(fields) == dict: return [fields]
-    field_list = []
-    if type(fields) == list:
+    if isinstance(fields, dict): return [fields]
+    if isinstance(fields, list):
        for f in fields:
-             if is_string_type(f):field_list.append({f:{}})
-             elif type(f) == dict:field_list.append(f)
-             else:raise ValueError('get_data error: the fields should be of type string or dictionary ')
-       return field_list
-    
-    raise ValueError('get_data error: the field parameter should be a string, a dictionary , or a list of strings or/and dictionaries ')
-
+             if not is_string_type(f) and not isinstance(f, dict):
+                 raise ValueError('get_data error: the fields should be of type string or dictionary ')
+       return [{f:{}} if is_string_type(f) else f for f in fields]
 
-def get_data_value(value):
-    if is_string_type(value):
-        return value
-    elif value is dict:
-        return value['value']
-    else:
-        return value
+    raise ValueError('get_data error: the field parameter should be a string, a dictionary , or a list of strings or/and dictionaries ')
 
 
 def get_data_frame(data_dict, field_name=False):
@@ -184,8 +182,8 @@ def get_data_frame(data_dict, field_name=False):
         headers = [header.get('field', header.get('displayName')) for header in data_dict['headers'][0]]
     else:
         headers = [header['displayName'] for header in data_dict['headers'][0]]
-    data = pd.np.array([[get_data_value(value) for value in row] for row in data_dict['data']])
-    df = pd.DataFrame(data, columns=headers)
-    df = df.apply(pd.to_numeric, errors='ignore')
+    df = pd.DataFrame.from_records(data_dict['data'], columns=headers)
+    for column in df.columns:
+        df[column] = pd.to_numeric(df[column], errors='ignore')
     errors = get_json_value(data_dict, 'error')
     return df, errors
\ No newline at end of file
@@ -7,9 +7,11 @@ class EikonError(Exception):
     :param error_code:
     :param message: description
     """
+    __slots__ = ('code', 'message')
+
     def __init__(self, code, message):
         self.code = code
         self.message = message
 
     def __str__(self):
-        return repr("Error code {0} | {1} ".format(self.code, self.message))
+        return f"Error code {self.code} | {self.message}"
@@ -7,6 +7,51 @@ from .eikonError import *
 import eikon.Profile
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads_response(response):
+        # parse the raw bytes directly, skipping the intermediate text
+        # decode that response.json() performs on large payloads
+        return orjson.loads(response.content)
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads_response(response):
+        return response.json()
+
+class _LazyStr(object):
+    """Defers building an expensive log message until a handler renders it."""
+    __slots__ = ('_func',)
+
+    def __init__(self, func):
+        self._func = func
+
+    def __str__(self):
+        return self._func()
+
+
+# pre-encoded request envelopes keyed by (entity, ID) — the endpoint names
+# are module constants so each one is serialized exactly once per session
+_envelope_cache = {}
+
+
+def _envelope(entity, ID):
+    parts = _envelope_cache.get((entity, ID))
+    if parts is None:
+        parts = _envelope_cache.setdefault(
+            (entity, ID),
+            (('{"Entity":{"E":"' + entity + '","W":').encode('utf-8'),
+             ('},"ID":"' + ID + '"}').encode('utf-8')))
+    return parts
+
 def send_json_request(entity, payload, ID='123', debug=False):
     """
     Returns the JSON response.
@@ -43,47 +88,41 @@ def send_json_request(entity, payload, ID='123', debug=False):
     EikonError
         If daemon is disconnected
     """
-    logger = eikon.Profile.get_profile().logger
+    profile = eikon.Profile.get_profile()
+    logger = profile.logger
 
     if debug:
-        logger.debug("entity: ", entity)
-        logger.debug("payload: ", payload)
+        logger.debug('entity: %s', entity)
+        logger.debug('payload: %s', payload)
 
-    profile = eikon.Profile.get_profile()
     if profile:
         if not is_string_type(entity):
             raise ValueError('entity must be a string identifying an UDF endpoint')
-        try:
-            if is_string_type(payload):
-                data = json.loads(payload)
-            elif type(payload) is dict:
-                data = payload
-            else:
-                raise ValueError('payload must be a string or a dictionary')
-        except json.decoder.JSONDecodeError:
-            raise ValueError('payload must be json well formed.')
+        prefix, suffix = _envelope(entity, ID)
+        if is_string_type(payload):
+            # the payload is already serialized JSON, so splice it into the
+            # request envelope instead of decoding and re-encoding it
+            request_body = prefix + payload.encode('utf-8') + suffix
+        elif type(payload) is dict:
+            request_body = prefix + _dumps(payload) + suffix
+        else:
+            raise ValueError('payload must be a string or a dictionary')
 
         try:
-            # build the request
-            udf_request = {'Entity': {'E': entity, 'W': data}, 'ID':ID}
-
-            if debug:
-                logger.debug('Request: {}'.format(json.dumps(udf_request)))
+            if debug and logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Request: %s', _LazyStr(lambda: request_body.decode('utf-8')))
 
-            response = profile.get_session().post(profile.get_url(),
-                                     data=json.dumps(udf_request),
-                                     headers={'Content-Type': 'application/json',
-                                              'x-tr-applicationid': profile.get_application_id()},
+            response = profile._post(profile.url,
+                                     data=request_body,
+                                     headers=profile._headers,
                                      timeout=60)
 
-            if debug:
-                try:
-                    logger.info('HTTP Response: {} - {}'.format(response.status_code, response.text))
-                except UnicodeEncodeError:
-                    logger.error('HTTP Response: cannot decode error message')
+            if debug and logger.isEnabledFor(logging.INFO):
+                logger.info('HTTP Response: %s - %s', response.status_code,
+                            _LazyStr(lambda: response.text))
 
             if response.status_code == 200:
-                result = response.json()
+                result = _loads_response(response)
                 check_server_error(result)
                 return result
             if response.status_code == 401:
@@ -99,6 +138,51 @@ def send_json_request(entity, payload, ID='123', debug=False):
 
         
 
+async def send_json_request_async(entity, payload, ID='123', debug=False):
+    """
+    Asynchronous variant of send_json_request built on httpx.
+
+    The request goes through a shared httpx.AsyncClient (HTTP/2 when
+    available), so many payloads can be in flight over a single connection
+    to the proxy. Parameters, return value and raised errors mirror
+    send_json_request. httpx is an optional dependency; an EikonError is
+    raised if it is not installed.
+    """
+    profile = eikon.Profile.get_profile()
+    logger = profile.logger
+
+    if not is_string_type(entity):
+        raise ValueError('entity must be a string identifying an UDF endpoint')
+
+    prefix, suffix = _envelope(entity, ID)
+    if is_string_type(payload):
+        request_body = prefix + payload.encode('utf-8') + suffix
+    elif type(payload) is dict:
+        request_body = prefix + _dumps(payload) + suffix
+    else:
+        raise ValueError('payload must be a string or a dictionary')
+
+    if debug and logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Request: %s', _LazyStr(lambda: request_body.decode('utf-8')))
+
+    client = profile.get_async_client()
+    response = await client.post(profile.url,
+                                 content=request_body,
+                                 headers=profile._headers)
+
+    if debug and logger.isEnabledFor(logging.INFO):
+        logger.info('HTTP Response: %s - %s', response.status_code,
+                    _LazyStr(lambda: response.text))
+
+    if response.status_code == 200:
+        result = _loads_response(response)
+        check_server_error(result)
+        return result
+    if response.status_code == 401:
+        raise EikonError('401', response.text)
+    raise requests.HTTPError(str(response), response=response)
+
+
 def check_server_error(server_response):
     """
     Check server response.
@@ -115,27 +199,19 @@ def check_server_error(server_response):
               ex: {u'ErrorCode': 500, u'ErrorMessage': u'Requested datapoint was not found: News_Headlines', u'Id': u''}
 
     """
-    str_response = str(server_response)
-
-    # check HTTPError on proxy request
-    if str_response.startswith('<') and str_response.endswith('>'):
-        raise requests.HTTPError(str_response, response=server_response)
-
-    if hasattr(server_response, 'ErrorCode'):
-        raise requests.HTTPError(server_response['ErrorMessage'], response=server_response)
+    # parsed responses are always dicts; anything else is a raw HTTP error
+    # from the proxy (ex: '<500 Server error>')
+    if not isinstance(server_response, dict):
+        str_response = str(server_response)
+        if str_response.startswith('<') and str_response.endswith('>'):
+            raise requests.HTTPError(str_response, response=server_response)
+        return
 
     # check UDF error
-    if 'ErrorCode' in server_response and 'ErrorMessage' in server_response:
-        error_message = server_response['ErrorMessage']
-        if len(error_message.split(',')) > 4:
-            status, reason_phrase, version, content, headers = error_message.split(',')[:5]
-            status_code = status.split(':')[1]
-        else:
-            status_code = server_response['ErrorCode']
+    error_message = server_response.get('ErrorMessage')
+    if server_response.get('ErrorCode') is not None and error_message is not None:
         raise requests.HTTPError(error_message, response=server_response)
 
     # check DataGrid error
     if 'error' in server_response and 'transactionId' in server_response:
-        error_message = server_response['error']
-        status_code = 500
-        raise requests.HTTPError(error_message, response=server_response)
+        raise requests.HTTPError(server_response['error'], response=server_response)
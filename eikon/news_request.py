@@ -9,6 +9,10 @@ import pandas as pd
 News_Headlines_UDF_endpoint = "News_Headlines"
 News_Story_UDF_endpoint = "News_Story"
 
+# payload skeletons copied per call so only the varying keys are rebuilt
+_Headlines_Payload = {'number': '10', 'query': None, 'productName': None, 'attributionCode': ''}
+_Story_Payload = {'attributionCode': '', 'productName': None, 'storyId': None}
+
 
 def get_news_headlines(query='Topic:TOPALL and Language:LEN', count=10, date_from=None,
                        date_to=None, raw_output=False, debug=False):
@@ -94,8 +98,10 @@ def get_news_headlines(query='Topic:TOPALL and Language:LEN', count=10, date_fro
         raise ValueError('count must be equal or greater than 0')
 
     # build the payload
-    app_id = eikon.get_app_id()
-    payload = {'number': str(count), 'query': query, 'productName': app_id, 'attributionCode': ''}
+    payload = _Headlines_Payload.copy()
+    payload['number'] = str(count)
+    payload['query'] = query
+    payload['productName'] = eikon.get_app_id()
 
     if date_from is not None:
         payload.update({'dateFrom': to_datetime(date_from).isoformat()})
@@ -118,11 +124,16 @@ def get_data_frame(json_data):
                              'sourceName', 'versionCreated']
  
     json_headlines_array = json_data['headlines']
-    first_created = [headline['firstCreated'] for headline in json_headlines_array]
-    headlines = [[headline[field] for field in Headline_Selected_Fields]
-                 for headline in json_headlines_array]
-    headlines_dataframe = pd.DataFrame(headlines, pd.np.array(first_created, dtype='datetime64'), Headline_Selected_Fields)
-    headlines_dataframe['versionCreated'] = headlines_dataframe.versionCreated.apply(pd.to_datetime)
+    # pandas' cached ISO-8601 parser yields a ns-resolution DatetimeIndex
+    # directly, skipping the object-dtype coercion path
+    first_created = pd.to_datetime([headline['firstCreated'] for headline in json_headlines_array],
+                                   utc=False, cache=True)
+    # build columns directly so pandas ingests the data without a transpose
+    columns = {field: [headline[field] for headline in json_headlines_array]
+               for field in Headline_Selected_Fields}
+    headlines_dataframe = pd.DataFrame(columns, index=first_created, columns=Headline_Selected_Fields)
+    headlines_dataframe['versionCreated'] = pd.to_datetime(headlines_dataframe['versionCreated'].values,
+                                                           errors='coerce')
     return headlines_dataframe
 
 def get_news_story(story_id, raw_output=False, debug=False):
@@ -158,8 +169,9 @@ def get_news_story(story_id, raw_output=False, debug=False):
            print (story)
     """
 
-    app_id = eikon.get_app_id()
-    payload = {'attributionCode': '', 'productName': app_id, 'storyId': story_id}
+    payload = _Story_Payload.copy()
+    payload['productName'] = eikon.get_app_id()
+    payload['storyId'] = story_id
     json_data = eikon.json_requests.send_json_request(News_Story_UDF_endpoint, payload, debug=debug)
 
     if raw_output:
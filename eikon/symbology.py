@@ -10,6 +10,13 @@ Symbology_UDF_endpoint = 'SymbologySearch'
 symbol_types = {"ric":"RIC", "isin":"ISIN", "cusip":"CUSIP", "sedol":"SEDOL",
                 "ticker":"ticker", "lipperid":"LipperID", "imo":"IMO", "oapermid":"OAPermID"}
 
+# symbol_types is already keyed by lowercase name, so per-call lookups need
+# no rebuilt dict; the error-message listing is rendered once here too
+_symbol_types_str = str([symbol_types[key] for key in symbol_types])
+
+# single C-level pass over the ASCII RICs, cheaper than islower()/upper() pairs
+_ric_upper_table = str.maketrans('abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
 
 def get_symbology(symbol, from_symbol_type='RIC', to_symbol_type=None, raw_output=False, debug=False, bestMatch=True):
     """
@@ -81,11 +88,11 @@ def get_symbology(symbol, from_symbol_type='RIC', to_symbol_type=None, raw_outpu
     try:
         from_symbol_type = symbol_types[from_symbol_type.lower()]
     except:
-        raise ValueError('from_symbol_type "' + from_symbol_type + '" should be in ' + [symbol_types[key] for key in symbol_types].__str__())
+        raise ValueError('from_symbol_type "' + from_symbol_type + '" should be in ' + _symbol_types_str)
 
-    # if from_symbol_type is RIC, apply rics = [ric.upper() if ric.islower() else ric for ric in rics ] transformation
-    if from_symbol_type is 'RIC':
-        symbol = [ric.upper() if ric.islower() else ric for ric in symbol]
+    # if from_symbol_type is RIC, apply the uppercase transformation
+    if from_symbol_type == 'RIC':
+        symbol = [ric.translate(_ric_upper_table) for ric in symbol]
 
     # to_symbol_type to None means request all symbol types
     if to_symbol_type is not None:
@@ -96,7 +103,7 @@ def get_symbology(symbol, from_symbol_type='RIC', to_symbol_type=None, raw_outpu
         try:
             to_symbol_type = [symbol_types[_.lower()] for _ in to_symbol_type]
         except:
-            raise ValueError('All items in the parameter to_symbol should be in ' + [symbol_types[key] for key in symbol_types].__str__())
+            raise ValueError('All items in the parameter to_symbol should be in ' + _symbol_types_str)
     payload ={'symbols': symbol,'from': from_symbol_type,'to': to_symbol_type,'bestMatchOnly': bestMatch}
     result = eikon.json_requests.send_json_request(Symbology_UDF_endpoint, payload, debug=debug)
    
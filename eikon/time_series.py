@@ -1,8 +1,11 @@
 # coding: utf-8
 
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import eikon.json_requests
-from .tools import is_string_type, check_for_string_or_list_of_strings, check_for_string, check_for_int, get_json_value, \
+import numpy as np
+from .tools import is_string_type, check_for_string_or_list_of_strings, check_for_string, check_for_int, \
     to_datetime, get_date_from_today
 import pandas as pd
 from eikon.eikonError import *
@@ -13,10 +16,17 @@ TimeSeries_UDF_endpoint = 'TimeSeries'
 Calendar_Values = ['native', 'tradingdays', 'calendardays']
 Corax_Values = ['adjusted', 'unadjusted']
 
+# single C-level pass over the ASCII RICs, cheaper than islower()/upper() pairs
+_ric_upper_table = str.maketrans('abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# chunking used when parallel=True: rics per request and concurrent requests
+_Parallel_Chunk_Size = 10
+_Parallel_Max_Workers = 4
+
 
 
 def get_timeseries(rics, fields='*', start_date=get_date_from_today(100), end_date=get_date_from_today(0), interval='daily', count=None,
-                   calendar=None, corax=None, normalize=False, raw_output=False, debug=False):
+                   calendar=None, corax=None, normalize=False, raw_output=False, parallel=False, debug=False):
     """
     Returns historical data on one or several RICs
 
@@ -75,6 +85,13 @@ def get_timeseries(rics, fields='*', start_date=get_date_from_today(100), end_da
         if set to False, the function will return a data frame which shape is defined by the parameter normalize
         Default: False
 
+    parallel: boolean
+        if set to True, a request with more than 10 rics is split into chunks
+        dispatched concurrently and the responses are merged, overlapping the
+        HTTP round trips. Each ric is still returned as its own entry so the
+        result is unchanged.
+        Default: False
+
     debug: bool
         When set to True, the json request and response are printed.
         Default: False
@@ -105,7 +122,7 @@ def get_timeseries(rics, fields='*', start_date=get_date_from_today(100), end_da
     if is_string_type(rics):
         rics = [rics.strip()]
 
-    if type(rics) == list: rics = [ric.upper() if ric.islower() else ric for ric in rics]
+    if type(rics) == list: rics = [ric.translate(_ric_upper_table) for ric in rics]
     payload = {'rics': rics}
 
     # set the field(s) in the payload
@@ -157,26 +174,34 @@ def get_timeseries(rics, fields='*', start_date=get_date_from_today(100), end_da
         else:
             raise ValueError('corax must be a string')
 
-    ts_result = eikon.json_requests.send_json_request(TimeSeries_UDF_endpoint, payload, debug=debug)
+    if parallel and len(rics) > _Parallel_Chunk_Size:
+        chunks = [rics[i:i + _Parallel_Chunk_Size] for i in range(0, len(rics), _Parallel_Chunk_Size)]
+        with ThreadPoolExecutor(max_workers=_Parallel_Max_Workers) as executor:
+            futures = [executor.submit(eikon.json_requests.send_json_request, TimeSeries_UDF_endpoint,
+                                       dict(payload, rics=chunk), debug=debug)
+                       for chunk in chunks]
+            results = [future.result() for future in futures]
+        ts_result = results[0]
+        ts_result['timeseriesData'] = [ts_data for result in results for ts_data in result['timeseriesData']]
+    else:
+        ts_result = eikon.json_requests.send_json_request(TimeSeries_UDF_endpoint, payload, debug=debug)
 
-    # Catch all errors to raise a warning
+    # Catch all errors to raise a warning, in a single pass over the data
     ts_timeserie_data = ts_result['timeseriesData']
-    ts_status_errors = [ts_data for ts_data in ts_timeserie_data if get_json_value(ts_data ,'statusCode')=='Error']
-
-    ts_error_messages = ''
-    for ts_status in ts_status_errors:
-        ts_error_message = get_json_value(ts_status, 'errorMessage')
+    ts_error_messages = []
+    for ts_data in ts_timeserie_data:
+        if ts_data.get('statusCode') != 'Error':
+            continue
+        ts_error_message = ts_data.get('errorMessage')
         ts_error_message = ts_error_message[ts_error_message.find("Description"):]
-        ts_instrument = get_json_value(ts_status, 'ric')
+        ts_instrument = ts_data.get('ric')
         ts_error_message = ts_error_message.replace('Description', ts_instrument)
-        ts_error_messages += ts_error_message
-        ts_error_messages += ' | '
-        warning_message = 'Error with {0}'.format(ts_error_message)
-        logger.warning(warning_message)
+        ts_error_messages.append(ts_error_message)
+        logger.warning('Error with {0}'.format(ts_error_message))
 
     #  if all timeseries are in error, then raise EikonError with all error messages
-    if len(ts_status_errors)==len(ts_timeserie_data):
-        raise EikonError('Error', message=ts_error_messages)
+    if len(ts_error_messages) == len(ts_timeserie_data):
+        raise EikonError('Error', message=' | '.join(ts_error_messages) + ' | ')
 
     if raw_output: return ts_result
 
@@ -187,44 +212,86 @@ def get_timeseries(rics, fields='*', start_date=get_date_from_today(100), end_da
         data_frame = NiceDataFrame_Formatter(ts_result).get_data_frame()
 
     if len(data_frame) > 0:
-        data_frame = data_frame.fillna(pd.np.nan)
+        data_frame = data_frame.fillna(np.nan)
     return data_frame
 
 
+def _split_datapoints(raw, timestamp_index):
+    """
+    Split the raw dataPoints rows into a datetime64 timestamp array and a
+    2-D value array, slicing the TIMESTAMP column out at the row level.
+
+    The values are built as a typed float64 buffer directly, avoiding the
+    object-dtype array the previous mixed string/float inference produced;
+    responses holding nulls or non-numeric fields fall back to an object
+    array which the DataFrame construction coerces as before.
+    """
+    count = len(raw)
+    timestamps = np.fromiter((row[timestamp_index] for row in raw),
+                             dtype='U32', count=count).astype('datetime64[ns]')
+    if timestamp_index == 0:
+        rows = [row[1:] for row in raw]
+    else:
+        rows = [row[:timestamp_index] + row[timestamp_index + 1:] for row in raw]
+    try:
+        datapoints = np.array(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        datapoints = np.array(rows, dtype=object)
+    return timestamps, datapoints
+
+
 class NormalizedDataFrame_Formatter():
+    __slots__ = ('json_data',)
+
     def __init__(self, json_data):
         self.json_data = json_data
 
     def get_data_frame(self):
         timeseriesList = self.json_data['timeseriesData']
-        data_dict_list = []
+
+        # first pass: split each valid timeseries and size the output columns
+        blocks = []
+        total_size = 0
         for timeseries in timeseriesList:
-            ric = timeseries['ric']
             error_code = timeseries['statusCode']
             if error_code.lower() == 'error':
                 continue
 
-            fields = [f['name'] for f in timeseries['fields']]
+            fields = [sys.intern(f['name']) for f in timeseries['fields']]
             timestamp_index = fields.index('TIMESTAMP')
             fields.pop(timestamp_index)  # remove timestamp from fields (timestamp is used as index for dataframe)
-            datapoints = pd.np.array(timeseries['dataPoints'])
-            timestamps = pd.np.array(datapoints[:, timestamp_index], dtype='datetime64')  # index for dataframe
-            datapoints = pd.np.delete(datapoints, pd.np.s_[timestamp_index], 1)  # remove timestamp column from numpy array
-            fiels_count = len(fields)
-            column_size = len(datapoints)
-            symbol_column = pd.np.array([ric] * fiels_count * column_size)
-            fields_column = pd.np.array(fields * column_size)
-            values_column = pd.np.concatenate(datapoints, axis=0)
-            timestamp_column = [[timestamps[i]] * fiels_count for i in range(timestamps.size)]
-            timestamp_column = pd.np.concatenate(timestamp_column, axis=0)
-            data_dict_list.append(
-                dict(Date=timestamp_column, Security=symbol_column, Field=fields_column, Value=values_column))
-
-        data_frames = [pd.DataFrame(data_dict, dtype='float') for data_dict in data_dict_list]
-        return pd.concat(data_frames)
+            timestamps, datapoints = _split_datapoints(timeseries['dataPoints'], timestamp_index)
+            blocks.append((timeseries['ric'], fields, timestamps, datapoints))
+            total_size += len(datapoints) * len(fields)
+
+        # second pass: fill one set of preallocated columns so a single
+        # DataFrame is built instead of one per ric followed by a concat
+        date_column = np.empty(total_size, dtype='datetime64[ns]')
+        security_column = np.empty(total_size, dtype=object)
+        field_column = np.empty(total_size, dtype=object)
+        value_column = np.empty(total_size, dtype=np.float64)
+        start = 0
+        for ric, fields, timestamps, datapoints in blocks:
+            fields_count = len(fields)
+            end = start + len(datapoints) * fields_count
+            date_column[start:end] = np.repeat(timestamps, fields_count)
+            security_column[start:end] = ric
+            field_column[start:end] = np.tile(np.asarray(fields, dtype=object), len(datapoints))
+            if datapoints.dtype == np.float64:
+                # a single memcpy (or a plain view) of the contiguous buffer
+                values = np.ascontiguousarray(datapoints).ravel()
+            else:
+                values = pd.to_numeric(datapoints.ravel(), errors='coerce')
+            value_column[start:end] = values
+            start = end
+
+        return pd.DataFrame({'Date': date_column, 'Security': security_column,
+                             'Field': field_column, 'Value': value_column}, copy=False)
 
 
 class NiceDataFrame_Formatter():
+    __slots__ = ('json_data',)
+
     def __init__(self, json_data):
         self.json_data = json_data
 
@@ -250,13 +317,17 @@ class NiceDataFrame_Formatter():
                 continue
 
             rics.append(ric)
-            fields = [f['name'] for f in timeseries['fields']]
+            fields = [sys.intern(f['name']) for f in timeseries['fields']]
             timestamp_index = fields.index('TIMESTAMP')
             fields.pop(timestamp_index)  # remove timestamp from fields (timestamp is used as index for dataframe)
-            unique_fields = fields
-            datapoints = pd.np.array(timeseries['dataPoints'])
-            timestamps = pd.np.array(datapoints[:, timestamp_index], dtype='datetime64')  # index for dataframe
-            datapoints = pd.np.delete(datapoints, pd.np.s_[timestamp_index], 1)  # remove timestamp column from numpy array
+            if not unique_fields:
+                unique_fields = fields
+            elif fields != unique_fields:
+                # the N rics shapes assume every ric reports the same fields
+                # in the same order
+                eikon.Profile.get_profile().logger.warning(
+                    'get_timeseries: inconsistent fields across rics ({0} vs {1})'.format(fields, unique_fields))
+            timestamps, datapoints = _split_datapoints(timeseries['dataPoints'], timestamp_index)
             df = pd.DataFrame(datapoints, columns=fields, index=timestamps, dtype='float')
             df.index.name = 'Date'
             data_frames.append(df)
@@ -269,22 +340,11 @@ class NiceDataFrame_Formatter():
         return data_frame
 
     def _get_frame_N_rics_1_field(self, data_frames, rics, fieldName):
-        ric_index = 0
-        for df in data_frames:
-            ric_name = rics[ric_index]
-            df.rename(columns={fieldName: ric_name}, inplace=True)
-            ric_index += 1
-        data_frame = pd.concat(data_frames, axis=1)
-        data_frame.axes[1].name = fieldName
+        data_frame = pd.concat(data_frames, axis=1, copy=False)
+        data_frame.columns = pd.Index(rics, name=fieldName)
         return data_frame
 
     def _get_frame_N_rics_N_fields(self, data_frames, rics, fields):
-        ric_index = 0
-        for df in data_frames:
-            ric_name = rics[ric_index]
-            columns = [(ric_name, f) for f in fields]
-            df.columns = pd.MultiIndex.from_tuples(columns)
-            ric_index += 1
-        data_frame = pd.concat(data_frames, axis=1)
-        data_frame.axes[1].names = ['Security', 'Field']
+        data_frame = pd.concat(data_frames, axis=1, copy=False)
+        data_frame.columns = pd.MultiIndex.from_product([rics, fields], names=['Security', 'Field'])
         return data_frame
@@ -3,20 +3,41 @@ from datetime import date, datetime, timedelta
 from dateutil.tz import tzlocal
 import dateutil.parser
 import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = json.loads if orjson is None else orjson.loads
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = None
+
+
+# resolve the python 2/3 string types once at import time so the type
+# checks below don't pay the NameError dance per value
+try:
+    _string_types = (basestring,)
+except NameError:
+    _string_types = (str,)
 
 
 def is_string_type(value):
-    try:
-        return isinstance(value, basestring)
-    except NameError:
-        return isinstance(value, str)
+    return isinstance(value, _string_types)
 
 
 def get_json_value(json_data, name):
-    if name in json_data:
-        return json_data[name]
-    else:
-        return None
+    return json_data.get(name)
+
+
+# shape of the ISO-8601 strings documented for the date parameters of the
+# public functions, handled by the C-level datetime.fromisoformat fast path
+_iso8601_date = re.compile(r'\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}:\d{2}(\.\d+)?)?$')
+_fromisoformat = getattr(datetime, 'fromisoformat', None)
 
 
 def to_datetime(date_value):
@@ -26,6 +47,18 @@ def to_datetime(date_value):
     if type(date_value) in (datetime, date):
         return date_value
 
+    if is_string_type(date_value):
+        if _parse_iso8601 is not None:
+            try:
+                return _parse_iso8601(date_value)
+            except ValueError:
+                pass  # not ISO-8601, let dateutil have a go at it
+        elif _fromisoformat is not None and _iso8601_date.match(date_value):
+            try:
+                return _fromisoformat(date_value)
+            except ValueError:
+                pass  # ex: out-of-range month/day, let dateutil report it
+
     try:
         return dateutil.parser.parse(date_value)
     except ValueError as e:
@@ -42,7 +75,7 @@ def get_date_from_today(days_count):
 
 
 def is_list_of_string(values):
-  return all(is_string_type(value) for value in values)
+  return all(isinstance(value, _string_types) for value in values)
 
 
 def check_for_string(parameter, name):
@@ -100,7 +133,7 @@ def build_dictionary(dic, name):
         raise ValueError(name + ' is None, it must be a string or a dictionary of strings')
 
     if is_string_type(dic):
-        return json.loads(dic)
+        return _loads(dic)
     elif type(dic) is dict:
         return dic
     else: